@@ -1,263 +1,747 @@
-import sys
-import subprocess
-import os
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QLabel,
-    QFileDialog, QComboBox, QMessageBox, QCheckBox, QGroupBox, QScrollArea
-)
-from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtCore import Qt
-
-TOOLS = [
-    ("Nuitka", "nuitka"),
-    ("PyInstaller", "pyinstaller"),
-    ("cx_Freeze", "cx_Freeze"),
-    ("py2exe (Windows only)", "py2exe"),
-    ("pyoxidizer", "pyoxidizer"),
-    ("auto-py-to-exe", "auto-py-to-exe"),
-]
-
-TOOL_EXPLAIN = [
-    "Nuitka (best protection: compiles to C/machine code) — Use with PyQt5 via Qt plugin!",
-    "PyInstaller (easy, common, cross-platform)",
-    "cx_Freeze (simple, multiplatform)",
-    "py2exe (Windows only, legacy)",
-    "pyoxidizer (advanced, single binary)",
-    "auto-py-to-exe (PyInstaller GUI, beginner-friendly)",
-]
-
-TOOL_FLAGS = [
-    # Nuitka
-    [
-        ("--onefile", "Bundle into one executable"),
-        ("--standalone", "Include all dependencies (portable)"),
-        ("--show-progress", "Show build progress"),
-        ("--noinclude-pytest-mode=nofollow", "Smaller EXE (strip pytest support)"),
-        ("--mingw64", "Use MinGW64 as C compiler (Windows only)"),
-        ("--windows-icon-from-ico=app.ico", "Custom app icon (replace path as needed)"),
-        ("--enable-plugin=pyqt5", "Enable PyQt5 plugin support for Qt GUIs in Nuitka"),
-        ("--include-qt-plugins=sensible", "Bundle sensible set of Qt plugins (most GUIs)"),
-    ],
-    # PyInstaller
-    [
-        ("--onefile", "Bundle into a single exe"),
-        ("--console", "Enable console window (needed for input())"),
-        ("--windowed", "No console window (GUI apps only)"),
-        ("--icon=app.ico", "Custom app icon (replace path as needed)"),
-        ("--clean", "Clean up temp files first"),
-        ("--add-data=data.file;.", "Add external data file (replace as needed)"),
-    ],
-    # cx_Freeze
-    [
-        ("base=None", "Console app (allows input())"),
-        ("base=Win32GUI", "GUI app (no console)"),
-        ("include_files", "Add extra files (use in setup.py)"),
-        ("silent=True", "Suppress cx_Freeze output"),
-    ],
-    # py2exe
-    [
-        ("console", "Console app (allows input())"),
-        ("windows", "GUI/windowed app"),
-        ("bundle_files=1", "Try single exe (not recommended for complex apps)"),
-        ("compressed=True", "Compress the library zip"),
-    ],
-    # pyoxidizer
-    [
-        ("single_binary=True", "Bundle everything in one binary (edit oxidizer.bzl)"),
-        ("--release", "Release mode build (smaller binary)"),
-        ("--debug", "Debug mode build"),
-    ],
-    # auto-py-to-exe
-    []
-]
-
-def set_dark_mode(app):
-    app.setStyle("Fusion")
-    palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.WindowText, Qt.white)
-    palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-    palette.setColor(QPalette.ToolTipBase, Qt.black)
-    palette.setColor(QPalette.ToolTipText, Qt.white)
-    palette.setColor(QPalette.Text, Qt.white)
-    palette.setColor(QPalette.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ButtonText, Qt.white)
-    palette.setColor(QPalette.BrightText, Qt.red)
-    palette.setColor(QPalette.Link, QColor(42, 130, 218))
-    palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.HighlightedText, Qt.black)
-    app.setPalette(palette)
-
-def get_install_commands(tool):
-    return f"""
-{tool} is required.
-
-Try these commands:
-    pip install {tool}
-or:
-    python -m pip install {tool}
-"""
-
-def ensure_installed(tool, parent_widget=None):
-    try:
-        __import__(tool)
-        return True
-    except ImportError:
-        try:
-            subprocess.run([sys.executable, "-m", "pip", "install", tool], check=True)
-            return True
-        except Exception:
-            if parent_widget:
-                QMessageBox.warning(parent_widget, "Missing Dependency", get_install_commands(tool))
-            return False
-
-class ExeBuilderApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Python EXE Builder With Dynamic Options")
-        self.setGeometry(90, 90, 780, 540)
-        self.file_path = None
-        self._init_ui()
-
-    def _init_ui(self):
-        widget = QWidget(self)
-        self.layout = QVBoxLayout(widget)
-        self.status = QLabel("Select a Python script and builder. Then check attributes to use.", self)
-        self.layout.addWidget(self.status)
-
-        self.select_btn = QPushButton("Select Python File", self)
-        self.select_btn.clicked.connect(self.select_file)
-        self.layout.addWidget(self.select_btn)
-
-        self.method_box = QComboBox(self)
-        for text in TOOL_EXPLAIN:
-            self.method_box.addItem(text)
-        self.method_box.currentIndexChanged.connect(self.show_flag_checkboxes)
-        self.layout.addWidget(self.method_box)
-
-        # Dynamic options area
-        self.flags_group = QGroupBox("Options")
-        self.flags_layout = QVBoxLayout()
-        self.flags_group.setLayout(self.flags_layout)
-
-        # Add scrolling in case there are many options
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(self.flags_group)
-        self.layout.addWidget(scroll)
-
-        self.checkboxes = []
-
-        self.build_btn = QPushButton("Build EXE (No Obfuscation)", self)
-        self.build_btn.clicked.connect(self.build_exe)
-        self.layout.addWidget(self.build_btn)
-
-        self.setCentralWidget(widget)
-        self.show_flag_checkboxes()
-
-    def select_file(self):
-        file, _ = QFileDialog.getOpenFileName(self, "Select Python File", "", "Python Files (*.py)")
-        if file:
-            self.file_path = file
-            self.status.setText(f"Selected: {os.path.basename(file)}")
-
-    def show_flag_checkboxes(self):
-        for i in reversed(range(self.flags_layout.count())):
-            w = self.flags_layout.itemAt(i).widget()
-            if w is not None:
-                self.flags_layout.removeWidget(w)
-                w.deleteLater()
-        self.checkboxes = []
-        idx = self.method_box.currentIndex()
-        for flag, explanation in TOOL_FLAGS[idx]:
-            cb = QCheckBox(f"{flag} ({explanation})")
-            self.flags_layout.addWidget(cb)
-            self.checkboxes.append(cb)
-        if idx == 5:
-            lab = QLabel("Use the GUI to set all options for PyInstaller visually.")
-            self.flags_layout.addWidget(lab)
-
-    def build_exe(self):
-        if not self.file_path:
-            self.status.setText("Please select a Python file first.")
-            return
-        method_idx = self.method_box.currentIndex()
-        tool_name = TOOLS[method_idx][1]
-        if not ensure_installed(tool_name, self):
-            self.status.setText(f"{tool_name} not available.")
-            return
-
-        flags = []
-        for i, cb in enumerate(self.checkboxes):
-            if cb.isChecked():
-                flag_or_opt = TOOL_FLAGS[method_idx][i][0]
-                flags.append(flag_or_opt)
-        try:
-            if method_idx == 0: # Nuitka
-                cmd = [sys.executable, "-m", "nuitka", self.file_path] + flags
-                subprocess.run(cmd, check=True)
-                self.status.setText("EXE built with Nuitka (output folder).")
-            elif method_idx == 1: # PyInstaller
-                cmd = [sys.executable, "-m", "PyInstaller", self.file_path] + flags + ["--hidden-import=colorama"]
-                subprocess.run(cmd, check=True)
-                self.status.setText("EXE built with PyInstaller (dist folder).")
-            elif method_idx == 2: # cx_Freeze
-                base = None
-                if "base=Win32GUI" in flags:
-                    base = "Win32GUI"
-                setup_code = f"""
-from cx_Freeze import setup, Executable
-setup(
-    name="{os.path.splitext(os.path.basename(self.file_path))[0]}",
-    version="0.1",
-    executables=[Executable("{self.file_path}"{', base="Win32GUI"' if base=="Win32GUI" else ''})]
-)
-"""
-                import tempfile
-                temp_dir = tempfile.mkdtemp()
-                setup_path = os.path.join(temp_dir, "setup.py")
-                with open(setup_path, "w") as f:
-                    f.write(setup_code)
-                subprocess.run([sys.executable, setup_path, "build"], cwd=temp_dir, check=True)
-                self.status.setText("EXE built with cx_Freeze (build folder in temp dir).")
-            elif method_idx == 3: # py2exe
-                console = "console" in flags
-                windows = "windows" in flags
-                if not (console or windows):
-                    console = True
-                setup_code = f"""
-from distutils.core import setup
-import py2exe
-setup({"console" if console else "windows"}=['{self.file_path}'])
-"""
-                import tempfile
-                temp_dir = tempfile.mkdtemp()
-                setup_path = os.path.join(temp_dir, "setup_py2exe.py")
-                with open(setup_path, "w") as f:
-                    f.write(setup_code)
-                subprocess.run([sys.executable, setup_path, "py2exe"], cwd=temp_dir, check=True)
-                self.status.setText("EXE built with py2exe (dist folder in temp dir).")
-            elif method_idx == 4: # pyoxidizer
-                cmd = ["pyoxidizer", "init-config", self.file_path]
-                subprocess.run(cmd, check=True)
-                cmd2 = ["pyoxidizer", "build"]
-                if "--release" in flags:
-                    cmd2.append("--release")
-                if "--debug" in flags:
-                    cmd2.append("--debug")
-                subprocess.run(cmd2, check=True)
-                self.status.setText("EXE built with pyoxidizer (see build artifacts).")
-            elif method_idx == 5: # auto-py-to-exe
-                cmd = ["auto-py-to-exe"]
-                subprocess.Popen(cmd)
-                self.status.setText("Opened auto-py-to-exe GUI. Use it to build your EXE.")
-        except Exception as e:
-            self.status.setText(f"Build failed: {str(e)}")
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    set_dark_mode(app)
-    win = ExeBuilderApp()
-    win.show()
-    sys.exit(app.exec_())
+from __future__ import annotations
+
+import sys
+import subprocess
+import os
+import codecs
+import functools
+import re
+import shutil
+import tempfile
+from collections import namedtuple
+from importlib.metadata import distribution, PackageNotFoundError
+from pathlib import PurePath
+
+# Matches a top-level or nested colorama import in script source
+_COLORAMA_RE = re.compile(rb"^\s*(?:import\s+colorama\b|from\s+colorama\b)", re.M)
+
+# windows_only tools are skipped by the prefetch and install-all actions on
+# other platforms, matching the platform_system marker in requirements.txt
+Tool = namedtuple("Tool", "label pkg explain flags windows_only", defaults=(False,))
+
+TOOLS_TABLE = (
+    Tool(
+        "Nuitka", "nuitka",
+        "Nuitka (best protection: compiles to C/machine code) — Use with PyQt5 via Qt plugin!",
+        (
+            ("--onefile", "Bundle into one executable"),
+            ("--standalone", "Include all dependencies (portable)"),
+            ("--show-progress", "Show build progress"),
+            ("--noinclude-pytest-mode=nofollow", "Smaller EXE (strip pytest support)"),
+            ("--mingw64", "Use MinGW64 as C compiler (Windows only)"),
+            ("--windows-icon-from-ico=app.ico", "Custom app icon (replace path as needed)"),
+            ("--enable-plugin=pyqt5", "Enable PyQt5 plugin support for Qt GUIs in Nuitka"),
+            ("--include-qt-plugins=sensible", "Bundle sensible set of Qt plugins (most GUIs)"),
+        ),
+    ),
+    Tool(
+        "PyInstaller", "pyinstaller",
+        "PyInstaller (easy, common, cross-platform)",
+        (
+            ("--onefile", "Bundle into a single exe"),
+            ("--console", "Enable console window (needed for input())"),
+            ("--windowed", "No console window (GUI apps only)"),
+            ("--icon=app.ico", "Custom app icon (replace path as needed)"),
+            ("--clean", "Clean up temp files first"),
+            ("--add-data=data.file;.", "Add external data file (replace as needed)"),
+        ),
+    ),
+    Tool(
+        "cx_Freeze", "cx_Freeze",
+        "cx_Freeze (simple, multiplatform)",
+        (
+            ("base=None", "Console app (allows input())"),
+            ("base=Win32GUI", "GUI app (no console)"),
+            ("include_files", "Add extra files (use in setup.py)"),
+            ("silent=True", "Suppress cx_Freeze output"),
+        ),
+    ),
+    Tool(
+        "py2exe (Windows only)", "py2exe",
+        "py2exe (Windows only, legacy)",
+        (
+            ("console", "Console app (allows input())"),
+            ("windows", "GUI/windowed app"),
+            ("bundle_files=1", "Try single exe (not recommended for complex apps)"),
+            ("compressed=True", "Compress the library zip"),
+        ),
+        windows_only=True,
+    ),
+    Tool(
+        "pyoxidizer", "pyoxidizer",
+        "pyoxidizer (advanced, single binary)",
+        (
+            ("single_binary=True", "Bundle everything in one binary (edit oxidizer.bzl)"),
+            ("--release", "Release mode build (smaller binary)"),
+            ("--debug", "Debug mode build"),
+        ),
+    ),
+    Tool(
+        "auto-py-to-exe", "auto-py-to-exe",
+        "auto-py-to-exe (PyInstaller GUI, beginner-friendly)",
+        (),
+    ),
+)
+
+def get_install_commands(tool):
+    return f"""
+{tool} is required.
+
+Try these commands:
+    pip install {tool}
+or:
+    python -m pip install {tool}
+"""
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds the same content."""
+    data = text.encode()
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    _atomic_write(path, data)
+    return True
+
+def _atomic_write(path, data):
+    """Replace path with data so readers never see a partially written file."""
+    dirn = os.path.dirname(path) or "."
+    if hasattr(os, "O_TMPFILE"):
+        try:
+            # Anonymous inode: nothing is left behind if we crash mid-write
+            fd = os.open(dirn, os.O_WRONLY | os.O_TMPFILE, 0o600)
+        except OSError:
+            fd = None  # filesystem without O_TMPFILE support
+        if fd is not None:
+            tmp_name = f".{os.path.basename(path)}.{os.getpid()}.tmp"
+            dir_fd = None
+            linked = False
+            try:
+                dir_fd = os.open(dirn, os.O_RDONLY | os.O_DIRECTORY)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                # dst_dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW),
+                # which is what materializes the /proc fd as a real file
+                os.link(f"/proc/self/fd/{fd}", tmp_name, dst_dir_fd=dir_fd)
+                linked = True
+                os.replace(tmp_name, os.path.basename(path), src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+                return
+            except OSError:
+                if linked:
+                    # Don't leave the linked temp name behind in the build dir
+                    try:
+                        os.unlink(tmp_name, dir_fd=dir_fd)
+                    except OSError:
+                        pass
+                    raise
+                # No /proc, a stale temp name from a crash, ...: use mkstemp below
+            finally:
+                os.close(fd)
+                if dir_fd is not None:
+                    os.close(dir_fd)
+    fd, tmp_path = tempfile.mkstemp(dir=dirn)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Tools already known to be installed in this process
+_install_cache: dict[str, bool] = {}
+
+def is_installed(tool):
+    if tool in _install_cache:
+        return _install_cache[tool]
+    # Reading the installed dist-info metadata avoids importing the package at
+    # all, and works for tools whose import name differs from the pip name
+    # (pyinstaller -> PyInstaller) or that have no importable module at all
+    # (auto-py-to-exe)
+    try:
+        distribution(tool)
+    except PackageNotFoundError:
+        return False
+    _install_cache[tool] = True
+    return True
+
+def cache_root():
+    # Wheels downloaded here are reused by later installs instead of hitting PyPI
+    from PyQt5.QtCore import QStandardPaths
+    return os.path.join(
+        QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation), "exe_builder_wheels")
+
+def pip_env():
+    from PyQt5.QtCore import QProcessEnvironment
+    env = QProcessEnvironment.systemEnvironment()
+    env.insert("PIP_NO_PYTHON_VERSION_WARNING", "1")
+    return env
+
+def pip_install_cmd(*tools, binary_only=True):
+    wheels = os.path.join(cache_root(), "wheels")
+    os.makedirs(wheels, exist_ok=True)
+    # Never prompt, skip the pip self-update check and prefer prebuilt wheels
+    cmd = [sys.executable, "-m", "pip", "--disable-pip-version-check", "install",
+           "--no-input", "--prefer-binary", "--cache-dir", os.path.join(cache_root(), "pip"),
+           f"--find-links={wheels}"]
+    if binary_only:
+        cmd.append("--only-binary=:all:")
+    return cmd + list(tools)
+
+def pip_download_cmd(tool, no_deps=True):
+    wheels = os.path.join(cache_root(), "wheels")
+    os.makedirs(wheels, exist_ok=True)
+    cmd = [sys.executable, "-m", "pip", "--disable-pip-version-check", "download",
+           "--no-input", "--prefer-binary", "--cache-dir", os.path.join(cache_root(), "pip"),
+           "-d", wheels]
+    if no_deps:
+        cmd.append("--no-deps")
+    return cmd + [tool]
+
+def _catch_build_errors(builder):
+    """Run a builder's commands, reporting any error in the status line."""
+    @functools.wraps(builder)
+    def wrapper(self, flags):
+        try:
+            commands, done_msg = builder(self, flags)
+        except Exception as e:
+            self.status.setText(f"Build failed: {str(e)}")
+            return
+        if commands:
+            self.run_commands(commands, done_msg)
+        else:
+            self.status.setText(done_msg)
+    return wrapper
+
+def _main():
+    # PyQt5 is only loaded when the builder GUI actually runs, so importing
+    # this module (e.g. from a spawned child process) stays cheap
+    from PyQt5.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QLabel,
+        QFileDialog, QComboBox, QMessageBox, QGroupBox, QPlainTextEdit, QListView
+    )
+    from PyQt5.QtGui import QPalette, QColor, QTextCursor
+    from PyQt5.QtCore import (
+        Qt, QProcess, QAbstractListModel, QModelIndex, QFileSystemWatcher, QTimer
+    )
+
+    def set_dark_mode(app):
+        app.setStyle("Fusion")
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor(53, 53, 53))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Base, QColor(25, 25, 25))
+        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+        palette.setColor(QPalette.ToolTipBase, Qt.black)
+        palette.setColor(QPalette.ToolTipText, Qt.white)
+        palette.setColor(QPalette.Text, Qt.white)
+        palette.setColor(QPalette.Button, QColor(53, 53, 53))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        palette.setColor(QPalette.BrightText, Qt.red)
+        palette.setColor(QPalette.Link, QColor(42, 130, 218))
+        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+        palette.setColor(QPalette.HighlightedText, Qt.black)
+        app.setPalette(palette)
+
+    class FlagsModel(QAbstractListModel):
+        """Checkable list of the current tool's flags; the checked set is kept per tool."""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._tool = 0
+            # Checked flag names per tool, kept up to date by setData
+            self._selected = [set() for _ in TOOLS_TABLE]
+
+        def set_tool(self, idx):
+            self.beginResetModel()
+            self._tool = idx
+            self.endResetModel()
+
+        def selected_flags(self, idx=None):
+            idx = self._tool if idx is None else idx
+            selected = self._selected[idx]
+            # Ordered like TOOLS_TABLE so generated command lines are stable
+            return [flag for flag, _ in TOOLS_TABLE[idx].flags if flag in selected]
+
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(TOOLS_TABLE[self._tool].flags)
+
+        def data(self, index, role=Qt.DisplayRole):
+            if not index.isValid():
+                return None
+            if role == Qt.DisplayRole:
+                flag, explanation = TOOLS_TABLE[self._tool].flags[index.row()]
+                return f"{flag} ({explanation})"
+            if role == Qt.CheckStateRole:
+                flag = TOOLS_TABLE[self._tool].flags[index.row()][0]
+                return Qt.Checked if flag in self._selected[self._tool] else Qt.Unchecked
+            return None
+
+        def setData(self, index, value, role=Qt.EditRole):
+            if role != Qt.CheckStateRole or not index.isValid():
+                return False
+            flag = TOOLS_TABLE[self._tool].flags[index.row()][0]
+            if value == Qt.Checked:
+                self._selected[self._tool].add(flag)
+            else:
+                self._selected[self._tool].discard(flag)
+            self.dataChanged.emit(index, index, [role])
+            return True
+
+        def flags(self, index):
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+
+    class ExeBuilderApp(QMainWindow):
+        def __init__(self):
+            super().__init__()
+            self.setWindowTitle("Python EXE Builder With Dynamic Options")
+            self.setGeometry(90, 90, 780, 540)
+            self.file_path = None
+            self.file_basename = None
+            self.file_stem = None
+            self.file_dir = None
+            self.proc = None
+            self._pending = []
+            self._done_msg = ""
+            self._on_success = None
+            self._on_failure = None
+            self._on_cancel = None
+            self._bg_procs = []
+            # Indexed like TOOLS_TABLE
+            self._builders = (
+                self._build_nuitka, self._build_pyinstaller, self._build_cxfreeze,
+                self._build_py2exe, self._build_pyoxidizer, self._build_auto,
+            )
+            # Temp build dirs reused per (script, tool) so rebuilds stay incremental
+            self._setup_dirs: dict[tuple[str, str], str] = {}
+            # script -> whether it imports colorama; invalidated by self.watcher
+            self._colorama_needed_cache: dict[str, bool] = {}
+            # Drops cached per-script results as soon as the script is modified
+            self.watcher = QFileSystemWatcher(self)
+            self.watcher.fileChanged.connect(self._on_script_changed)
+            self.watcher.directoryChanged.connect(self._on_script_changed)
+            self._init_ui()
+
+        def _init_ui(self):
+            widget = QWidget(self)
+            self.layout = QVBoxLayout(widget)
+            self.status = QLabel("Select a Python script and builder. Then check attributes to use.", self)
+            self.layout.addWidget(self.status)
+
+            self.select_btn = QPushButton("Select Python File", self)
+            self.select_btn.clicked.connect(self.select_file)
+            self.layout.addWidget(self.select_btn)
+
+            self.method_box = QComboBox(self)
+            for tool in TOOLS_TABLE:
+                self.method_box.addItem(tool.explain)
+            # Coalesce rapid arrow-key scrolling so only the final tool is applied;
+            # start() is called without the index, which it would take as msec
+            self._switch_timer = QTimer(self)
+            self._switch_timer.setSingleShot(True)
+            self._switch_timer.setInterval(30)
+            self._switch_timer.timeout.connect(self._apply_tool_switch)
+            self.method_box.currentIndexChanged.connect(lambda _: self._switch_timer.start())
+            self.layout.addWidget(self.method_box)
+
+            # Dynamic options area
+            self.flags_group = QGroupBox("Options")
+            self.flags_layout = QVBoxLayout()
+            self.flags_group.setLayout(self.flags_layout)
+
+            # Flags are plain data in a model; the view only renders visible rows
+            self.model = FlagsModel(self)
+            self.flags_view = QListView()
+            self.flags_view.setModel(self.model)
+            self.flags_layout.addWidget(self.flags_view)
+            self.auto_hint = QLabel("Use the GUI to set all options for PyInstaller visually.")
+            self.flags_layout.addWidget(self.auto_hint)
+            self.layout.addWidget(self.flags_group)
+
+            self.build_btn = QPushButton("Build EXE (No Obfuscation)", self)
+            self.build_btn.clicked.connect(self.build_exe)
+            self.layout.addWidget(self.build_btn)
+
+            self.prefetch_btn = QPushButton("Prefetch all builders", self)
+            self.prefetch_btn.clicked.connect(self.prefetch_builders)
+            self.layout.addWidget(self.prefetch_btn)
+
+            self.install_all_btn = QPushButton("Install all builders", self)
+            self.install_all_btn.clicked.connect(self.install_all_builders)
+            self.layout.addWidget(self.install_all_btn)
+
+            self.cancel_btn = QPushButton("Cancel Build", self)
+            self.cancel_btn.setEnabled(False)
+            self.cancel_btn.clicked.connect(self.cancel_build)
+            self.layout.addWidget(self.cancel_btn)
+
+            # Builder output is streamed here while the process runs
+            self.log = QPlainTextEdit(self)
+            self.log.setReadOnly(True)
+            self.layout.addWidget(self.log)
+
+            # Output chunks are collected here and flushed to the log in
+            # batches, so a chatty builder costs one text insert per tick
+            self._log_chunks = []
+            self._log_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self._log_timer = QTimer(self)
+            self._log_timer.setSingleShot(True)
+            self._log_timer.setInterval(100)
+            self._log_timer.timeout.connect(self._flush_log)
+
+            self.setCentralWidget(widget)
+            self._apply_tool_switch()
+
+            build_menu = self.menuBar().addMenu("Build")
+            clean_action = build_menu.addAction("Clean build")
+            clean_action.triggered.connect(self.clean_build)
+
+        def select_file(self):
+            file, _ = QFileDialog.getOpenFileName(self, "Select Python File", "", "Python Files (*.py)")
+            if file:
+                self.set_file(file)
+                self.status.setText(f"Selected: {self.file_basename}")
+
+        def set_file(self, file):
+            # Parse the path once; builders, the watcher and cache keys reuse these
+            p = PurePath(file)
+            self.file_path = file
+            self.file_basename = p.name
+            self.file_stem = p.stem
+            self.file_dir = str(p.parent)
+            self._watch_script()
+
+        def _setup_dir(self, tool_name):
+            key = (self.file_path, tool_name)
+            temp_dir = self._setup_dirs.get(key)
+            if temp_dir is None or not os.path.isdir(temp_dir):
+                temp_dir = tempfile.mkdtemp()
+                self._setup_dirs[key] = temp_dir
+            return temp_dir
+
+        def _watch_script(self):
+            watched = self.watcher.files() + self.watcher.directories()
+            if watched:
+                self.watcher.removePaths(watched)
+            # The directory is watched too, to catch editors that save via rename
+            self.watcher.addPaths([self.file_path, self.file_dir])
+
+        def _on_script_changed(self, path):
+            self._colorama_needed_cache.pop(self.file_path, None)
+            # A replace-on-save drops the file from the watcher; watch the new one
+            if self.file_path not in self.watcher.files() and os.path.exists(self.file_path):
+                self.watcher.addPath(self.file_path)
+
+        def _needs_colorama(self):
+            # No stat() per build: the watcher clears the entry when the script changes
+            if self.file_path not in self._colorama_needed_cache:
+                with open(self.file_path, "rb") as f:
+                    needed = bool(_COLORAMA_RE.search(f.read()))
+                self._colorama_needed_cache[self.file_path] = needed
+            return self._colorama_needed_cache[self.file_path]
+
+        def clean_build(self):
+            # The cx_Freeze/py2exe working dir must not vanish under a running build
+            if self.proc is not None and self.proc.state() != QProcess.NotRunning:
+                self.status.setText("Cannot clean the build cache while a build is running.")
+                return
+            for temp_dir in self._setup_dirs.values():
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            self._setup_dirs.clear()
+            self.status.setText("Build cache cleared.")
+
+        def _apply_tool_switch(self):
+            idx = self.method_box.currentIndex()
+            self.model.set_tool(idx)
+            self.auto_hint.setVisible(idx == 5)
+
+        def build_exe(self):
+            if not self.file_path:
+                self.status.setText("Please select a Python file first.")
+                return
+            method_idx = self.method_box.currentIndex()
+            tool_name = TOOLS_TABLE[method_idx].pkg
+            self.log.clear()
+            if is_installed(tool_name):
+                self._run_builder(method_idx)
+            else:
+                self.install_tool(tool_name, lambda: self._run_builder(method_idx))
+
+        def install_tool(self, tool_name, then):
+            """Install tool_name with pip in the background, then call then()."""
+            def installed():
+                _install_cache[tool_name] = True
+                # Keep this tool's own wheel on disk so a reinstall can pick it up via
+                # --find-links; its dependencies still come from the index
+                self.start_background(pip_download_cmd(tool_name))
+                then()
+
+            def not_available():
+                self.status.setText(f"{tool_name} not available.")
+                QMessageBox.warning(self, "Missing Dependency", get_install_commands(tool_name))
+
+            def retry_from_source():
+                # Some builders only publish sdists for newer Python versions
+                self.run_commands([(pip_install_cmd(tool_name, binary_only=False), None)],
+                                  f"{tool_name} installed.", installed, not_available)
+
+            self.run_commands([(pip_install_cmd(tool_name), None)],
+                              f"{tool_name} installed.", installed, retry_from_source)
+
+        def prefetch_builders(self):
+            """Download every builder into the wheel cache in parallel."""
+            pkgs = [tool.pkg for tool in TOOLS_TABLE
+                    if not (tool.windows_only and sys.platform != "win32")]
+            results = []
+
+            def one_done(ok):
+                results.append(ok)
+                if len(results) == len(pkgs):
+                    self.prefetch_btn.setEnabled(True)
+                    self.status.setText(f"Prefetched {sum(results)}/{len(pkgs)} builders.")
+
+            self.prefetch_btn.setEnabled(False)
+            self.status.setText("Prefetching builders...")
+            for pkg in pkgs:
+                self.start_background(pip_download_cmd(pkg), one_done)
+
+        def install_all_builders(self):
+            """Fetch every missing builder in parallel, then install them in one pip run."""
+            if not self.build_btn.isEnabled():
+                self.status.setText("Wait for the current build or install to finish.")
+                return
+            missing = [tool.pkg for tool in TOOLS_TABLE
+                       if not (tool.windows_only and sys.platform != "win32")
+                       and not is_installed(tool.pkg)]
+            if not missing:
+                self.status.setText("All builders are already installed.")
+                return
+            downloaded = {}
+
+            def install_downloaded():
+                ok = [pkg for pkg in missing if downloaded[pkg]]
+                failed = [pkg for pkg in missing if not downloaded[pkg]]
+
+                def report(installed):
+                    if installed:
+                        for pkg in ok:
+                            _install_cache[pkg] = True
+                    else:
+                        failed[:0] = ok
+                    done = [pkg for pkg in ok if installed]
+                    self.install_all_btn.setEnabled(True)
+                    self.build_btn.setEnabled(True)
+                    self.status.setText(f"Installed: {', '.join(done) or 'none'}. "
+                                        f"Failed: {', '.join(failed) or 'none'}.")
+
+                if not ok:
+                    report(False)
+                    return
+                # A single pip run avoids concurrent writes to site-packages; the
+                # builders and their dependencies were already downloaded in
+                # parallel above and are picked up from the wheel cache via --find-links
+                self.log.clear()
+                self.run_commands([(pip_install_cmd(*ok, binary_only=False), None)], "",
+                                  lambda: report(True), lambda: report(False),
+                                  lambda: report(False))
+
+            def one_done(pkg, ok):
+                downloaded[pkg] = ok
+                if len(downloaded) == len(missing):
+                    install_downloaded()
+
+            self.install_all_btn.setEnabled(False)
+            self.build_btn.setEnabled(False)
+            self.status.setText(f"Downloading: {', '.join(missing)}")
+            for pkg in missing:
+                self.start_background(pip_download_cmd(pkg, no_deps=False),
+                                      lambda ok, pkg=pkg: one_done(pkg, ok))
+
+        def start_background(self, cmd, on_done=None):
+            """Run cmd in its own QProcess alongside any build; output is discarded."""
+            proc = QProcess(self)
+            proc.setProcessEnvironment(pip_env())
+            proc.setProgram(cmd[0])
+            proc.setArguments(cmd[1:])
+
+            def finished(exit_code=-1, exit_status=QProcess.CrashExit):
+                self._bg_procs.remove(proc)
+                proc.deleteLater()
+                if on_done is not None:
+                    on_done(exit_status == QProcess.NormalExit and exit_code == 0)
+
+            proc.finished.connect(finished)
+            proc.errorOccurred.connect(
+                lambda error: finished() if error == QProcess.FailedToStart else None)
+            self._bg_procs.append(proc)
+            proc.start()
+
+        def _run_builder(self, method_idx):
+            self._builders[method_idx](self.model.selected_flags(method_idx))
+
+        # Each builder returns ([(cmd, cwd), ...], done_msg) for run_commands
+
+        @_catch_build_errors
+        def _build_nuitka(self, flags):
+            cmd = [sys.executable, "-m", "nuitka", self.file_path] + flags
+            return [(cmd, None)], "EXE built with Nuitka (output folder)."
+
+        @_catch_build_errors
+        def _build_pyinstaller(self, flags):
+            cmd = [sys.executable, "-m", "PyInstaller", self.file_path] + flags
+            if self._needs_colorama():
+                cmd.append("--hidden-import=colorama")
+            return [(cmd, None)], "EXE built with PyInstaller (dist folder)."
+
+        @_catch_build_errors
+        def _build_cxfreeze(self, flags):
+            # repr() emits properly escaped literals for any path (backslashes, quotes)
+            exe_kwargs = {"script": self.file_path}
+            if "base=Win32GUI" in flags:
+                exe_kwargs["base"] = "Win32GUI"
+            setup_code = f"""
+from cx_Freeze import setup, Executable
+setup(
+    name={self.file_stem!r},
+    version="0.1",
+    executables=[Executable(**{exe_kwargs!r})]
+)
+"""
+            temp_dir = self._setup_dir("cx_Freeze")
+            setup_path = os.path.join(temp_dir, "setup.py")
+            write_if_changed(setup_path, setup_code)
+            cmd = [sys.executable, setup_path, "build"]
+            return [(cmd, temp_dir)], "EXE built with cx_Freeze (build folder in temp dir)."
+
+        @_catch_build_errors
+        def _build_py2exe(self, flags):
+            console = "console" in flags
+            windows = "windows" in flags
+            if not (console or windows):
+                console = True
+            setup_code = f"""
+from distutils.core import setup
+import py2exe
+setup({"console" if console else "windows"}=[{self.file_path!r}])
+"""
+            temp_dir = self._setup_dir("py2exe")
+            setup_path = os.path.join(temp_dir, "setup_py2exe.py")
+            write_if_changed(setup_path, setup_code)
+            cmd = [sys.executable, setup_path, "py2exe"]
+            return [(cmd, temp_dir)], "EXE built with py2exe (dist folder in temp dir)."
+
+        @_catch_build_errors
+        def _build_pyoxidizer(self, flags):
+            cmd = ["pyoxidizer", "init-config", self.file_path]
+            cmd2 = ["pyoxidizer", "build"]
+            if "--release" in flags:
+                cmd2.append("--release")
+            if "--debug" in flags:
+                cmd2.append("--debug")
+            return [(cmd, None), (cmd2, None)], "EXE built with pyoxidizer (see build artifacts)."
+
+        @_catch_build_errors
+        def _build_auto(self, flags):
+            # auto-py-to-exe is its own GUI, so it is launched and left running
+            subprocess.Popen(["auto-py-to-exe"])
+            return [], "Opened auto-py-to-exe GUI. Use it to build your EXE."
+
+        def run_commands(self, commands, done_msg, on_success=None, on_failure=None,
+                         on_cancel=None):
+            """Run (cmd, cwd) pairs one after another in a QProcess without blocking the GUI."""
+            self._pending = list(commands)
+            self._done_msg = done_msg
+            self._on_success = on_success
+            self._on_failure = on_failure
+            # Called instead of on_failure when the run is killed or crashes,
+            # so callers can clean up without e.g. retrying a cancelled install
+            self._on_cancel = on_cancel
+            self._log_decoder.reset()
+            self.build_btn.setEnabled(False)
+            self.install_all_btn.setEnabled(False)
+            self.cancel_btn.setEnabled(True)
+            self._start_next()
+
+        def _start_next(self):
+            cmd, cwd = self._pending.pop(0)
+            if self.proc is not None:
+                self.proc.deleteLater()
+            # No console-suppression flags needed: on Windows QProcess already
+            # passes CREATE_NO_WINDOW when this GUI runs without a console
+            self.proc = QProcess(self)
+            self.proc.setProcessEnvironment(pip_env())
+            self.proc.setProcessChannelMode(QProcess.MergedChannels)
+            self.proc.setProgram(cmd[0])
+            self.proc.setArguments(cmd[1:])
+            if cwd:
+                self.proc.setWorkingDirectory(cwd)
+            self.proc.readyReadStandardOutput.connect(self._on_proc_output)
+            self.proc.finished.connect(self._on_proc_finished)
+            self.proc.errorOccurred.connect(self._on_proc_error)
+            self.status.setText(f"Running: {' '.join(cmd)}")
+            self.proc.start()
+
+        def _on_proc_output(self):
+            self._log_chunks.append(bytes(self.proc.readAllStandardOutput()))
+            if not self._log_timer.isActive():
+                self._log_timer.start()
+
+        def _flush_log(self, final=False):
+            self._log_timer.stop()
+            if not self._log_chunks and not final:
+                return
+            # The incremental decoder keeps UTF-8 sequences split across reads intact;
+            # final=True emits whatever it still holds once the process has exited
+            text = self._log_decoder.decode(b"".join(self._log_chunks), final=final)
+            self._log_chunks = []
+            if not text:
+                return
+            self.log.moveCursor(QTextCursor.End)
+            self.log.insertPlainText(text)
+
+        def _on_proc_finished(self, exit_code, exit_status):
+            self._flush_log(final=True)
+            if exit_status == QProcess.NormalExit and exit_code == 0:
+                if self._pending:
+                    self._start_next()
+                    return
+                self.status.setText(self._done_msg)
+                self._build_finished(self._on_success)
+            elif exit_status == QProcess.CrashExit:
+                self.status.setText("Build cancelled or crashed.")
+                self._build_finished(self._on_cancel)
+            else:
+                self.status.setText(f"Build failed: exit code {exit_code}")
+                self._build_finished(self._on_failure)
+
+        def _on_proc_error(self, error):
+            # finished() is not emitted when the program could not be started
+            if error == QProcess.FailedToStart:
+                self.status.setText(f"Build failed: could not start {self.proc.program()}")
+                self._build_finished(self._on_failure)
+
+        def _build_finished(self, callback):
+            self._pending = []
+            self._on_success = self._on_failure = self._on_cancel = None
+            self.build_btn.setEnabled(True)
+            self.install_all_btn.setEnabled(True)
+            self.cancel_btn.setEnabled(False)
+            if callback is not None:
+                callback()
+
+        def cancel_build(self):
+            if self.proc is not None and self.proc.state() != QProcess.NotRunning:
+                self._pending = []
+                self.proc.kill()
+
+    app = QApplication(sys.argv)
+    set_dark_mode(app)
+    win = ExeBuilderApp()
+    win.show()
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    _main()